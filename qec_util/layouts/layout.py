@@ -1,6 +1,7 @@
 """Module that implement the layout class."""
 from __future__ import annotations
 
+from collections.abc import Hashable
 from copy import copy, deepcopy
 from os import path
 from pathlib import Path
@@ -14,6 +15,8 @@ from xarray import DataArray
 IntDirections = List[str]
 IntOrder = Union[IntDirections, Dict[str, IntDirections]]
 
+DIRECTIONS = ("north_east", "north_west", "south_east", "south_west")
+
 
 class Layout:
     """
@@ -56,12 +59,32 @@ class Layout:
         self.description = setup.get("description")
         self.interaction_order = setup.get("interaction_order")
 
-        self.graph = nx.DiGraph()
+        self._graph = nx.DiGraph()
         self._load_layout(setup)
+        self._index_layout()
 
-        qubits = list(self.graph.nodes)
-        num_qubits = len(qubits)
-        self._qubit_inds = dict(zip(qubits, range(num_qubits)))
+    @property
+    def graph(self) -> nx.DiGraph:
+        """
+        graph Returns the directed graph of the layout.
+
+        The layout is indexed again before the next query, such that changes
+        made to the graph through this property are taken into account. Changes
+        made later through a previously returned reference are not tracked,
+        so use set_param to change the qubit parameters instead.
+
+        Returns
+        -------
+        nx.DiGraph
+            The directed graph of the layout.
+        """
+        self._is_indexed = False
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: nx.DiGraph) -> None:
+        self._graph = graph
+        self._is_indexed = False
 
     def __copy__(self) -> Layout:
         """
@@ -90,23 +113,15 @@ class Layout:
         setup["description"] = self.description
         setup["interaction_order"] = self.interaction_order
 
+        self._update_index()
+
         layout = []
-        for node, attrs in self.graph.nodes(data=True):
-            node_dict = deepcopy(attrs)
+        for node, attrs in self._graph.nodes(data=True):
+            node_dict = copy_attrs(attrs)
             node_dict["qubit"] = node
 
-            nbr_dict = dict()
-            adj_view = self.graph.adj[node]
-
-            for nbr_node, edge_attrs in adj_view.items():
-                edge_dir = edge_attrs["direction"]
-                nbr_dict[edge_dir] = nbr_node
-
-            for ver_dir in ("north", "south"):
-                for hor_dir in ("east", "west"):
-                    edge_dir = f"{ver_dir}_{hor_dir}"
-                    if edge_dir not in nbr_dict:
-                        nbr_dict[edge_dir] = None
+            nbr_dict = dict.fromkeys(DIRECTIONS)
+            nbr_dict.update(self._neighbors[node])
 
             node_dict["neighbors"] = nbr_dict
 
@@ -123,7 +138,8 @@ class Layout:
         List[int]
             The list of qubit indices.
         """
-        inds = [self._qubit_inds[qubit] for qubit in qubits]
+        self._update_index()
+        inds = list(map(self._qubit_inds.__getitem__, qubits))
         return inds
 
     def get_qubits(self, **conds: Any) -> List[str]:
@@ -139,14 +155,24 @@ class Layout:
         Returns
         -------
         List[str]
-            The list of qubit indices that meet all conditions.
+            The list of qubit indices that meet all conditions. Qubits that do not
+            define a parameter never meet its condition.
+
+        Raises
+        ------
+        KeyError
+            If none of the qubits define a parameter in the conditions.
         """
+        self._update_index()
+
         if conds:
-            node_view = self.graph.nodes(data=True)
-            nodes = [node for node, attrs in node_view if valid_attrs(attrs, **conds)]
+            mask = np.ones(len(self._qubit_inds), dtype=bool)
+            for param, value in conds.items():
+                mask &= valid_values(self._params[param], value)
+            nodes = self._qubit_arr[mask].tolist()
             return nodes
 
-        nodes = list(self.graph.nodes)
+        nodes = list(self._graph.nodes)
         return nodes
 
     def get_neighbors(
@@ -178,29 +204,33 @@ class Layout:
         List[str]
             The list of qubit label, neighboring qubit, that meet the conditions.
         """
-        edge_view = self.graph.out_edges(qubits, data=True)
+        self._update_index()
+
+        if isinstance(qubits, Hashable) and qubits in self._neighbors:
+            qubits = [qubits]
 
-        start_nodes = []
-        end_nodes = []
-        for start_node, end_node, attrs in edge_view:
-            if direction is None or attrs["direction"] == direction:
-                start_nodes.append(start_node)
-                end_nodes.append(end_node)
+        pairs = []
+        for qubit in qubits:
+            nbr_dict = self._neighbors.get(qubit, {})
+            if direction is None:
+                pairs.extend((qubit, nbr) for nbr in nbr_dict.values())
+            elif direction in nbr_dict:
+                pairs.append((qubit, nbr_dict[direction]))
 
         if as_pairs:
-            return list(zip(start_nodes, end_nodes))
-        return end_nodes
+            return pairs
+        return [nbr for _, nbr in pairs]
 
     def index_qubits(self) -> Layout:
         """index_qubits Returns a copy of the layout, where the qubits are indexed by integers."""
         indexed_layout = copy(self)
-        nodes = list(self.graph.nodes)
+        nodes = list(self._graph.nodes)
 
         num_nodes = len(nodes)
         inds = list(range(num_nodes))
 
         mapping = dict(zip(nodes, inds))
-        relabled_graph = nx.relabel_nodes(indexed_layout.graph, mapping)
+        relabled_graph = nx.relabel_nodes(indexed_layout._graph, mapping)
         for node, ind in zip(nodes, inds):
             relabled_graph.nodes[ind]["name"] = node
         indexed_layout.graph = relabled_graph
@@ -219,10 +249,8 @@ class Layout:
             The adjacency matrix
         """
         qubits = self.get_qubits()
-        adj_matrix = nx.adjacency_matrix(self.graph)
-
         data_arr = DataArray(
-            data=adj_matrix.toarray(),
+            data=self._adjacency_array().copy(),
             dims=["from_qubit", "to_qubit"],
             coords=dict(
                 from_qubit=qubits,
@@ -241,25 +269,10 @@ class Layout:
         DataArray
             The expansion matrix.
         """
-        node_view = self.graph.nodes(data=True)
-
-        anc_qubits = [node for node, data in node_view if data["role"] == "anc"]
-        coords = [node_view[anc]["coords"] for anc in anc_qubits]
-
-        rows, cols = zip(*coords)
-
-        row_inds, num_rows = index_coords(rows, reverse=True)
-        col_inds, num_cols = index_coords(cols)
-
-        num_anc = len(anc_qubits)
-        anc_inds = range(num_anc)
-
-        tensor = np.zeros((num_anc, num_rows, num_cols), dtype=bool)
-        tensor[anc_inds, row_inds, col_inds] = True
-        expanded_tensor = np.expand_dims(tensor, axis=1)
+        tensor, anc_qubits = self._expansion_tensor()
 
         expansion_tensor = DataArray(
-            expanded_tensor,
+            tensor.copy(),
             dims=["anc_qubit", "channel", "row", "col"],
             coords=dict(
                 anc_qubit=anc_qubits,
@@ -289,13 +302,90 @@ class Layout:
         DataArray
             The projection matrix.
         """
-        adj_mat = self.adjacency_matrix()
+        proj_mat, data_qubits, anc_qubits = self._projection_tensor(stab_type)
+
+        data_arr = DataArray(
+            proj_mat.copy(),
+            dims=["data_qubit", "anc_qubit"],
+            coords=dict(
+                data_qubit=data_qubits,
+                anc_qubit=anc_qubits,
+            ),
+        )
+        return data_arr
+
+    def _expansion_tensor(self) -> Tuple[np.ndarray, List[str]]:
+        """
+        _expansion_tensor Internal function that returns the expansion tensor
+        as a numpy array, together with the ancilla qubits along its first axis.
+
+        The tensor is cached, so it must not be modified.
+
+        Returns
+        -------
+        Tuple[np.ndarray, List[str]]
+            The expansion tensor and the list of ancilla qubits.
+        """
+        self._update_index()
+
+        key = ("expansion",)
+        if key in self._matrix_cache:
+            return self._matrix_cache[key]
+
+        anc_qubits = self.get_qubits(role="anc")
+        coords = [self.param("coords", anc) for anc in anc_qubits]
+
+        rows, cols = zip(*coords)
+
+        row_inds, num_rows = index_coords(rows, reverse=True)
+        col_inds, num_cols = index_coords(cols)
+
+        num_anc = len(anc_qubits)
+        anc_inds = range(num_anc)
+
+        tensor = np.zeros((num_anc, num_rows, num_cols), dtype=bool)
+        tensor[anc_inds, row_inds, col_inds] = True
+        expanded_tensor = np.expand_dims(tensor, axis=1)
+
+        self._matrix_cache[key] = (expanded_tensor, anc_qubits)
+        return expanded_tensor, anc_qubits
+
+    def _projection_tensor(
+        self, stab_type: str
+    ) -> Tuple[np.ndarray, List[str], List[str]]:
+        """
+        _projection_tensor Internal function that returns the projection matrix
+        as a numpy array, together with the data and ancilla qubits along its axes.
+
+        The matrix is cached, so it must not be modified.
+
+        Parameters
+        ----------
+        stab_type : str
+            The type of the stabilizers that the data qubit measurement
+            is being projected to.
+
+        Returns
+        -------
+        Tuple[np.ndarray, List[str], List[str]]
+            The projection matrix, the list of data qubits and the list
+            of ancilla qubits.
+        """
+        self._update_index()
+
+        key = ("projection", stab_type)
+        if key in self._matrix_cache:
+            return self._matrix_cache[key]
 
         anc_qubits = self.get_qubits(role="anc", stab_type=stab_type)
         data_qubits = self.get_qubits(role="data")
 
-        proj_mat = adj_mat.sel(from_qubit=data_qubits, to_qubit=anc_qubits)
-        return proj_mat.rename(from_qubit="data_qubit", to_qubit="anc_qubit")
+        data_inds = self.get_inds(data_qubits)
+        anc_inds = self.get_inds(anc_qubits)
+        proj_mat = self._adjacency_array()[np.ix_(data_inds, anc_inds)]
+
+        self._matrix_cache[key] = (proj_mat, data_qubits, anc_qubits)
+        return proj_mat, data_qubits, anc_qubits
 
     @classmethod
     def from_yaml(cls, filename: Union[str, Path]) -> "Layout":
@@ -358,8 +448,18 @@ class Layout:
         -------
         Any
             The value of the parameter
+
+        Raises
+        ------
+        KeyError
+            If the qubit does not define the parameter.
         """
-        return self.graph.nodes[qubit][param]
+        self._update_index()
+
+        value = self._params[param][self._qubit_inds[qubit]]
+        if value is None and param not in self._graph.nodes[qubit]:
+            raise KeyError(param)
+        return value
 
     def set_param(self, param: str, qubit: str, value: Any) -> None:
         """
@@ -374,7 +474,15 @@ class Layout:
         value : Any
             The new value of the qubit parameter.
         """
-        self.graph.nodes[qubit][param] = value
+        self._update_index()
+
+        self._graph.nodes[qubit][param] = value
+
+        if param not in self._params:
+            self._params[param] = np.full(len(self._qubit_inds), None, dtype=object)
+        self._params[param][self._qubit_inds[qubit]] = value
+
+        self._matrix_cache.clear()
 
     def _load_layout(self, setup: Dict[str, Any]) -> None:
         """
@@ -401,16 +509,85 @@ class Layout:
             if qubit is None:
                 raise ValueError("Each qubit in the layout must be labeled.")
 
-            if qubit in self.graph:
+            if qubit in self._graph:
                 raise ValueError("Qubit label repeated, ensure labels are unique.")
 
-            self.graph.add_node(qubit, **qubit_info)
+            self._graph.add_node(qubit, **qubit_info)
 
-        for node, attrs in self.graph.nodes(data=True):
+        for node, attrs in self._graph.nodes(data=True):
             nbr_dict = attrs.pop("neighbors", None)
             for edge_dir, nbr_qubit in nbr_dict.items():
                 if nbr_qubit is not None:
-                    self.graph.add_edge(node, nbr_qubit, direction=edge_dir)
+                    self._graph.add_edge(node, nbr_qubit, direction=edge_dir)
+
+    def _index_layout(self) -> None:
+        """
+        _index_layout Internal function that builds the lookup tables derived
+        from the directed graph, which are used to query the layout.
+
+        The qubit indices follow the order of the graph nodes.
+        The neighbors of each qubit are stored as a direction to label dictionary.
+        The edges are stored as an array of (from, to) qubit index pairs.
+        The parameters are stored as one object array per parameter.
+        The tables are built again after the graph property is accessed.
+        """
+        qubits = list(self._graph.nodes)
+        num_qubits = len(qubits)
+        self._qubit_inds = dict(zip(qubits, range(num_qubits)))
+
+        self._neighbors = {qubit: dict() for qubit in qubits}
+        edge_inds = []
+        for node, nbr_node, edge_dir in self._graph.edges(data="direction"):
+            self._neighbors[node][edge_dir] = nbr_node
+            edge_inds.append((self._qubit_inds[node], self._qubit_inds[nbr_node]))
+        self._edge_inds = np.array(edge_inds, dtype=int).reshape(-1, 2)
+
+        self._qubit_arr = np.empty(num_qubits, dtype=object)
+        self._params: Dict[str, np.ndarray] = dict()
+        for ind, (qubit, attrs) in enumerate(self._graph.nodes(data=True)):
+            self._qubit_arr[ind] = qubit
+            for param, value in attrs.items():
+                if param not in self._params:
+                    self._params[param] = np.full(num_qubits, None, dtype=object)
+                self._params[param][ind] = value
+
+        self._adj_matrix: Optional[np.ndarray] = None
+        self._matrix_cache: Dict[Tuple[str, ...], Tuple[Any, ...]] = dict()
+        self._is_indexed = True
+
+    def _update_index(self) -> None:
+        """
+        _update_index Internal function that indexes the layout again if its graph
+        might have been changed through the graph property.
+        """
+        if not self._is_indexed:
+            self._index_layout()
+
+    def _adjacency_array(self) -> np.ndarray:
+        """
+        _adjacency_array Internal function that returns the dense adjacency
+        matrix of the layout, filled in a single pass from the edge indices.
+
+        The matrix is built once and cached, so it must not be modified.
+
+        Returns
+        -------
+        np.ndarray
+            The adjacency matrix, with rows and columns ordered as the qubits.
+        """
+        self._update_index()
+
+        if self._adj_matrix is not None:
+            return self._adj_matrix
+
+        num_qubits = len(self._qubit_inds)
+        adj_matrix = np.zeros((num_qubits, num_qubits), dtype=int)
+
+        from_inds, to_inds = self._edge_inds.T
+        adj_matrix[from_inds, to_inds] = 1
+
+        self._adj_matrix = adj_matrix
+        return adj_matrix
 
     def sublayout(
         self,
@@ -426,26 +603,21 @@ class Layout:
         setup["description"] = description
         setup["interaction_order"] = self.interaction_order
 
+        qubit_set = set(qubits)
+
+        self._update_index()
+
         layout = []
-        for node, attrs in self.graph.nodes(data=True):
-            if node in qubits:
-                node_dict = deepcopy(attrs)
+        for node, attrs in self._graph.nodes(data=True):
+            if node in qubit_set:
+                node_dict = copy_attrs(attrs)
                 node_dict["qubit"] = node
 
-                nbr_dict = dict()
-                adj_view = self.graph.adj[node]
-
-                for nbr_node, edge_attrs in adj_view.items():
-                    if nbr_node in qubits:
-                        edge_dir = edge_attrs["direction"]
+                nbr_dict = dict.fromkeys(DIRECTIONS)
+                for edge_dir, nbr_node in self._neighbors[node].items():
+                    if nbr_node in qubit_set:
                         nbr_dict[edge_dir] = nbr_node
 
-                for ver_dir in ("north", "south"):
-                    for hor_dir in ("east", "west"):
-                        edge_dir = f"{ver_dir}_{hor_dir}"
-                        if edge_dir not in nbr_dict:
-                            nbr_dict[edge_dir] = None
-
                 node_dict["neighbors"] = nbr_dict
 
                 layout.append(node_dict)
@@ -476,6 +648,81 @@ def valid_attrs(attrs: Dict[str, Any], **conditions: Any) -> bool:
     return True
 
 
+def valid_values(values: np.ndarray, condition: Any) -> np.ndarray:
+    """
+    valid_values Checks which of the values of a parameter match a condition.
+    Scalar conditions are compared against all values at once, while other
+    conditions (e.g. lists) are compared against each value separately.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The object array of parameter values, one per qubit.
+    condition : Any
+        The value that the parameter needs to take.
+
+    Returns
+    -------
+    np.ndarray
+        The boolean mask of the values that match the condition. Values
+        equal to None never match.
+    """
+    if condition is None:
+        return np.zeros(len(values), dtype=bool)
+    if np.ndim(condition) == 0:
+        return np.asarray(values == condition, dtype=bool)
+    return np.array([value == condition for value in values], dtype=bool)
+
+
+def is_immutable(value: Any) -> bool:
+    """
+    is_immutable Checks if a value is an immutable scalar (str, int, float, bool
+    or None) or a tuple of such values, such that it can be shared safely.
+
+    Parameters
+    ----------
+    value : Any
+        The value to check.
+
+    Returns
+    -------
+    bool
+        Whether the value is immutable.
+    """
+    if isinstance(value, tuple):
+        return all(is_immutable(item) for item in value)
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def copy_attrs(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    copy_attrs Copies a dictionary of qubit attributes.
+
+    Immutable values are shared, lists of immutable values are copied shallowly
+    and every other value is deep-copied, which avoids the overhead of deepcopy
+    for the typical parameters of a qubit (labels, numbers and coordinates).
+
+    Parameters
+    ----------
+    attrs : Dict[str, Any]
+        The attribute dictionary.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The copied attribute dictionary.
+    """
+    attrs_copy = dict()
+    for key, val in attrs.items():
+        if is_immutable(val):
+            attrs_copy[key] = val
+        elif isinstance(val, list) and all(map(is_immutable, val)):
+            attrs_copy[key] = list(val)
+        else:
+            attrs_copy[key] = deepcopy(val)
+    return attrs_copy
+
+
 def index_coords(coords: List[int], reverse: bool = False) -> Tuple[List[int], int]:
     """
     index_coords Indexes a list of coordinates.
@@ -491,16 +738,12 @@ def index_coords(coords: List[int], reverse: bool = False) -> Tuple[List[int], i
     -------
     Tuple[List[int], int]
         The list of indexed coordinates and the number of unique coordinates.
+        The coordinates are indexed in increasing (or decreasing, if reversed) order.
     """
-    unique_vals = set(coords)
+    unique_vals, indices = np.unique(coords, return_inverse=True)
     num_unique_vals = len(unique_vals)
 
     if reverse:
-        unique_inds = reversed(range(num_unique_vals))
-    else:
-        unique_inds = range(num_unique_vals)
-
-    mapping = dict(zip(unique_vals, unique_inds))
+        indices = (num_unique_vals - 1) - indices
 
-    indicies = [mapping[coord] for coord in coords]
-    return indicies, num_unique_vals
+    return indices.tolist(), num_unique_vals
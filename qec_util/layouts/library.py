@@ -1,10 +1,22 @@
 """Module implementing layout generator for the surface code."""
-from collections import defaultdict
-from functools import partial
-from itertools import count, cycle, product
-from typing import Dict, Tuple
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
-from .layout import Layout
+import numpy as np
+
+from .layout import DIRECTIONS, Layout
+
+SHIFT_DIRECTIONS = {
+    (1, 1): "north_east",
+    (1, -1): "north_west",
+    (-1, 1): "south_east",
+    (-1, -1): "south_west",
+}  # Direction of each diagonal (row, column) shift
+INV_DIRECTIONS = {
+    direction: SHIFT_DIRECTIONS[(-row_shift, -col_shift)]
+    for (row_shift, col_shift), direction in SHIFT_DIRECTIONS.items()
+}  # Opposite of each direction
 
 
 def get_data_index(row: int, col: int, distance: int, start_ind: int = 1) -> int:
@@ -49,10 +61,9 @@ def shift_direction(row_shift: int, col_shift: int) -> str:
     str
         The direction.
     """
-    ver_direction = "north" if row_shift > 0 else "south"
-    hor_direction = "east" if col_shift > 0 else "west"
-    direction = f"{ver_direction}_{hor_direction}"
-    return direction
+    row_sign = 1 if row_shift > 0 else -1
+    col_sign = 1 if col_shift > 0 else -1
+    return SHIFT_DIRECTIONS[(row_sign, col_sign)]
 
 
 def invert_shift(row_shift: int, col_shift: int) -> Tuple[int, int]:
@@ -99,25 +110,37 @@ def is_valid(row: int, col: int, max_size: int) -> bool:
     return True
 
 
-def add_missing_neighbours(neighbor_data: Dict) -> None:
+def rot_surf_code(distance: int) -> Layout:
     """
-    add_missing_neighbours Adds None for missing neighbours in the neighbor data. Note that this modifies the dictionary in place.
+    rot_surf_code Generates a rotated surface code layout.
+
+    The layout setup is cached per distance, such that repeated calls only
+    construct a new Layout from it. Each call returns an independent layout.
 
     Parameters
     ----------
-    neighbor_data : Dict
-        The neighbor data - a dictionary that contains information about the layout connectivity (defined on a square grid, connection run diagonally).
+    distance : int
+        The distance of the code.
+
+    Returns
+    -------
+    Layout
+        The layout of the code.
     """
-    directions = ["north_east", "north_west", "south_east", "south_west"]
-    for neighbors in neighbor_data.values():
-        for direction in directions:
-            if direction not in neighbors:
-                neighbors[direction] = None
+    setup = _rot_surf_code_setup(distance)
+
+    # The layout list is copied by the Layout, but the interaction order is not.
+    int_order = deepcopy(setup["interaction_order"])
+    layout_setup = dict(setup, interaction_order=int_order)
+    layout = Layout(layout_setup)  # Create the layout
+    return layout
 
 
-def rot_surf_code(distance: int) -> Layout:
+@lru_cache(maxsize=32)
+def _rot_surf_code_setup(distance: int) -> Dict[str, Any]:
     """
-    rot_surf_code Generates a rotated surface code layout.
+    _rot_surf_code_setup Generates the setup dictionary of a rotated surface
+    code layout. The result is cached and must not be modified.
 
     Parameters
     ----------
@@ -126,8 +149,8 @@ def rot_surf_code(distance: int) -> Layout:
 
     Returns
     -------
-    Layout
-        The layout of the code.
+    Dict[str, Any]
+        The layout setup of the code.
     """
     _check_distance(distance)  # Check if distance is an integer and is odd and positive
 
@@ -149,106 +172,108 @@ def rot_surf_code(distance: int) -> Layout:
         interaction_order=int_order,
     )  # Layout setup
 
-    grid_size = 2 * distance + 1  # Grid size
-    data_indexer = partial(
-        get_data_index, distance=distance, start_ind=1
-    )  # Indexer for data qubits
-    valid_coord = partial(
-        is_valid, max_size=grid_size
-    )  # Check if a coordinate is valid
+    data_coords, anc_coords, anc_nbr_inds = _rot_surf_code_grid(distance)
 
-    pos_shifts = (1, -1)  # Possible shifts
-    nbr_shifts = tuple(product(pos_shifts, repeat=2))  # Neighbour shifts
+    nbr_dirs = tuple(
+        (direction, INV_DIRECTIONS[direction])
+        for direction in SHIFT_DIRECTIONS.values()
+    )  # Direction and inverse direction of each neighbour shift
 
     layout_data = []  # Layout data
-    neighbor_data = defaultdict(dict)  # Neighbour data dictionary
-
-    freq_seq = cycle(("low", "high"))  # Frequency sequence
 
     # Add the data quibts - basically data qubits are in a grid over the odd rows/columns of the code layout
-    for row in range(1, grid_size, 2):
-        freq_group = next(freq_seq)
-        for col in range(1, grid_size, 2):
-            index = data_indexer(row, col)
-
-            qubit_info = dict(
-                qubit=f"D{index}",
-                role="data",
-                coords=[row, col],
-                freq_group=freq_group,
-                stab_type=None,
-            )
-            layout_data.append(qubit_info)
-
-    # Add the x-type ancilla qubits. Ancilla qubits take up even rows/columns.
-    x_index = count(1)
-    for row in range(0, grid_size, 2):
-        for col in range(2 + row % 4, grid_size - 1, 4):
-            anc_qubit = f"X{next(x_index)}"
-            qubit_info = dict(
-                qubit=anc_qubit,
-                role="anc",
-                coords=[row, col],
-                freq_group="mid",
-                stab_type="x_type",
-            )
-            layout_data.append(qubit_info)
+    data_neighbors = [dict.fromkeys(DIRECTIONS) for _ in data_coords]
+    for index, (row, col) in enumerate(data_coords.tolist(), start=1):
+        qubit_info = dict(
+            qubit=f"D{index}",
+            role="data",
+            coords=[row, col],
+            freq_group="low" if row % 4 == 1 else "high",  # Alternate by row
+            stab_type=None,
+            neighbors=data_neighbors[index - 1],
+        )
+        layout_data.append(qubit_info)
+
+    # Add the ancilla qubits, first the x-type and then the z-type ones.
+    for stab_type in ("x_type", "z_type"):
+        prefix = stab_type[0].upper()
+        coords = anc_coords[stab_type].tolist()
+        nbr_inds = anc_nbr_inds[stab_type].tolist()
+
+        for anc_index, ((row, col), data_inds) in enumerate(zip(coords, nbr_inds), 1):
+            anc_qubit = f"{prefix}{anc_index}"
+            anc_neighbors = dict.fromkeys(DIRECTIONS)
 
             # Add data qubit neighbors and vice-versa
-            for row_shift, col_shift in nbr_shifts:
-                data_row, data_col = row + row_shift, col + col_shift
-                if not valid_coord(data_row, data_col):
+            for (direction, inv_direction), data_index in zip(nbr_dirs, data_inds):
+                if data_index < 0:
                     continue
-                data_index = data_indexer(data_row, data_col)
-                data_qubit = f"D{data_index}"
-
-                direction = shift_direction(row_shift, col_shift)
-                neighbor_data[anc_qubit][direction] = data_qubit
-
-                inv_shifts = invert_shift(row_shift, col_shift)
-                inv_direction = shift_direction(*inv_shifts)
-                neighbor_data[data_qubit][inv_direction] = anc_qubit
+                anc_neighbors[direction] = f"D{data_index}"
+                data_neighbors[data_index - 1][inv_direction] = anc_qubit
 
-    # Add the z-type ancilla qubits. Ancilla qubits take up even rows/columns.
-    z_index = count(1)
-    for row in range(2, grid_size - 1, 2):
-        for col in range(row % 4, grid_size, 4):
-            anc_qubit = f"Z{next(z_index)}"
             qubit_info = dict(
                 qubit=anc_qubit,
                 role="anc",
                 coords=[row, col],
                 freq_group="mid",
-                stab_type="z_type",
+                stab_type=stab_type,
+                neighbors=anc_neighbors,
             )
             layout_data.append(qubit_info)
 
-            # Add data qubit neighbors and vice-versa
-            for row_shift, col_shift in nbr_shifts:
-                data_row, data_col = row + row_shift, col + col_shift
-                if not valid_coord(data_row, data_col):
-                    continue
-                data_index = data_indexer(data_row, data_col)
-                data_qubit = f"D{data_index}"
-
-                direction = shift_direction(row_shift, col_shift)
-                neighbor_data[anc_qubit][direction] = data_qubit
+    layout_setup["layout"] = layout_data
+    return layout_setup
 
-                inv_shifts = invert_shift(row_shift, col_shift)
-                inv_direction = shift_direction(*inv_shifts)
-                neighbor_data[data_qubit][inv_direction] = anc_qubit
 
-    # Fill in missing neighbours with None
-    add_missing_neighbours(neighbor_data)
+def _rot_surf_code_grid(
+    distance: int,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    _rot_surf_code_grid Computes the numerical skeleton of the rotated surface
+    code layout on a (2 * distance + 1) square grid, using only array operations.
 
-    # Add the neighbours to the layout data
-    for qubit_info in layout_data:
-        qubit = qubit_info["qubit"]
-        qubit_info["neighbors"] = neighbor_data[qubit]
+    Parameters
+    ----------
+    distance : int
+        The distance of the code.
 
-    layout_setup["layout"] = layout_data
-    layout = Layout(layout_setup)  # Create the layout
-    return layout
+    Returns
+    -------
+    Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray]]
+        The coordinates of the data qubits, ordered by their index, the coordinates
+        of the ancilla qubits of each stabilizer type and, for each such ancilla,
+        the indices of the neighbouring data qubits along each of the shifts in
+        SHIFT_DIRECTIONS, where -1 marks a missing neighbour.
+    """
+    grid_size = 2 * distance + 1  # Grid size
+    nbr_shifts = np.array(list(SHIFT_DIRECTIONS))  # Neighbour shifts
+
+    # Data qubits are in a grid over the odd rows/columns of the code layout
+    data_rows, data_cols = np.mgrid[1:grid_size:2, 1:grid_size:2]
+    data_coords = np.column_stack((data_rows.ravel(), data_cols.ravel()))
+
+    # Ancilla qubits take up even rows/columns, alternating between x-type and z-type checks.
+    anc_rows, anc_cols = np.mgrid[0:grid_size:2, 0:grid_size:2]
+    diag_shifts = (anc_cols - anc_rows) % 4
+    anc_masks = dict(
+        x_type=(diag_shifts == 2) & (anc_cols >= 2) & (anc_cols < grid_size - 1),
+        z_type=(diag_shifts == 0) & (anc_rows >= 2) & (anc_rows < grid_size - 1),
+    )
+
+    anc_coords = dict()
+    anc_nbr_inds = dict()
+    for stab_type, anc_mask in anc_masks.items():
+        coords = np.column_stack((anc_rows[anc_mask], anc_cols[anc_mask]))
+
+        nbr_coords = coords[:, np.newaxis, :] + nbr_shifts
+        nbr_rows, nbr_cols = nbr_coords[..., 0], nbr_coords[..., 1]
+        valid_coords = np.all((nbr_coords >= 0) & (nbr_coords < grid_size), axis=2)
+        nbr_inds = get_data_index(nbr_rows, nbr_cols, distance=distance)
+
+        anc_coords[stab_type] = coords
+        anc_nbr_inds[stab_type] = np.where(valid_coords, nbr_inds, -1)
+
+    return data_coords, anc_coords, anc_nbr_inds
 
 
 def _check_distance(distance: int) -> None:
@@ -1,11 +1,15 @@
 """Layout plotting module."""
 import re
-from typing import Sequence, Union, Tuple, Reversible, Iterable
+from functools import lru_cache
+from string import digits
+from typing import Dict, Optional, Sequence, Union, Tuple, Reversible, Iterable
 from copy import deepcopy
 
 import numpy as np
 
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
 from matplotlib.patches import Circle, Polygon
 from matplotlib.lines import Line2D
@@ -20,6 +24,32 @@ RE_FILTER = re.compile("([a-zA-Z]+)([0-9]+)")  # Regex to filter qubit labels
 
 ZORDERS = dict(circle=3, patch=1, line=2, text=4)
 
+CLOCKWISE_DIRECTIONS = ("south_west", "north_west", "north_east", "south_east")
+
+# Line parameters that are preserved when merging lines into a LineCollection
+MERGEABLE_LINE_PARAMS = {"color", "c", "alpha", "linewidth", "lw", "linestyle", "ls"}
+
+# Patch parameters that are preserved when merging patches into a PatchCollection
+MERGEABLE_PATCH_PARAMS = {
+    "color",
+    "facecolor",
+    "fc",
+    "edgecolor",
+    "ec",
+    "fill",
+    "alpha",
+    "linewidth",
+    "lw",
+    "linestyle",
+    "ls",
+    "antialiased",
+    "aa",
+    "radius",
+}
+
+# Line styles that hide a line or an edge, which collections draw as solid instead
+NONE_LINESTYLES = {"None", "none", "", " "}
+
 
 def clockwise_sort(coordinates: Sequence[Coordinates]) -> Sequence[Coordinates]:
     """
@@ -67,6 +97,39 @@ def invert(sequence: Reversible) -> Tuple:
     return tuple(reversed(sequence))
 
 
+@lru_cache(maxsize=None)
+def latex_label(qubit: str) -> str:
+    """
+    latex_label Formats a qubit label as a LaTeX string with a subscripted index.
+    The results are cached, as the same labels are formatted on every plot.
+
+    Parameters
+    ----------
+    qubit : str
+        The qubit label.
+
+    Returns
+    -------
+    str
+        The formatted label.
+
+    Raises
+    ------
+    ValueError
+        If the qubit label is not in the expected format.
+    """
+    # Fast path for the common labels of letters followed by digits, e.g. "D12".
+    name = qubit.rstrip(digits)
+    ind = qubit[len(name) :]
+    if not (ind and name.isascii() and name.isalpha()):
+        match = RE_FILTER.match(qubit)
+        if match is None:
+            raise ValueError(f"Unexpected qubit label {qubit}")
+        name, ind = match.groups()
+    text = f"${name}_\\mathrm{{{ind}}}$"
+    return text
+
+
 def get_label(qubit: str, coords: Coordinates, **kwargs) -> Text:
     """
     label_qubit Labels a qubit.
@@ -85,11 +148,7 @@ def get_label(qubit: str, coords: Coordinates, **kwargs) -> Text:
     ValueError
         If the qubit label is not in the expected format.
     """
-    match = RE_FILTER.match(str(qubit))
-    if match is None:
-        raise ValueError(f"Unexpected qubit label {qubit}")
-    name, ind = match.groups()
-    text = f"${name}_\\mathrm{{{ind}}}$"
+    text = latex_label(str(qubit))
 
     x, y = coords
     zorder = ZORDERS["text"]
@@ -151,11 +210,195 @@ def get_line(coordinates: Sequence[Coordinates], **kwargs) -> Line2D:
     return line
 
 
-def qubit_labels(layout: Layout) -> Iterable[Text]:
+def line_capstyle(line: Line2D) -> str:
+    """
+    line_capstyle Returns the cap style that a line is drawn with, which depends
+    on whether the line is dashed.
+
+    Parameters
+    ----------
+    line : Line2D
+        The line.
+
+    Returns
+    -------
+    str
+        The cap style of the line.
+    """
+    if line.is_dashed():
+        return line.get_dash_capstyle()
+    return line.get_solid_capstyle()
+
+
+def get_line_collection(lines: Sequence[Line2D]) -> LineCollection:
+    """
+    get_line_collection Merges a sequence of lines into a single collection,
+    keeping the color, alpha, width and named style of each individual line.
+    Lines with a hidden ('None') style are left out, as collections draw them
+    as solid lines. Any other line property (e.g. markers or dashes) is dropped
+    and the cap style of the first visible line is used for all lines.
+
+    Parameters
+    ----------
+    lines : Sequence[Line2D]
+        The lines to merge.
+
+    Returns
+    -------
+    LineCollection
+        The collection of lines.
+    """
+    lines = [line for line in lines if line.get_linestyle() not in NONE_LINESTYLES]
+
+    segments = [line.get_xydata() for line in lines]
+    colors = [to_rgba(line.get_color(), line.get_alpha()) for line in lines]
+    widths = [line.get_linewidth() for line in lines]
+    styles = [line.get_linestyle() for line in lines]
+    capstyle = line_capstyle(lines[0]) if lines else None
+
+    zorder = ZORDERS["line"]
+    collection = LineCollection(
+        segments,
+        colors=colors,
+        linewidths=widths,
+        linestyles=styles,
+        capstyle=capstyle,
+        zorder=zorder,
+    )
+    return collection
+
+
+def mergeable_lines(layout: Layout, lines: Sequence[Line2D]) -> bool:
+    """
+    mergeable_lines Checks if the connection lines of a layout only use line
+    parameters that are preserved by get_line_collection and if all visible
+    lines share the same cap style.
+
+    Parameters
+    ----------
+    layout : Layout
+        The layout.
+    lines : Sequence[Line2D]
+        The connection lines of the layout.
+
+    Returns
+    -------
+    bool
+        Whether the connection lines can be merged into a single collection.
+    """
+    for anc_qubit in layout.get_qubits(role="anc"):
+        line_params = layout.param("metaparams", anc_qubit).get("line") or {}
+        if not MERGEABLE_LINE_PARAMS.issuperset(line_params):
+            return False
+        for key in ("linestyle", "ls"):
+            if not isinstance(line_params.get(key, "-"), str):
+                return False
+
+    capstyles = set(
+        line_capstyle(line)
+        for line in lines
+        if line.get_linestyle() not in NONE_LINESTYLES
+    )
+    return len(capstyles) <= 1
+
+
+def get_patch_collection(
+    patches: Sequence[Polygon], zorder: int, rasterized: bool = False
+) -> PatchCollection:
+    """
+    get_patch_collection Merges a sequence of patches into a single collection,
+    keeping the colors, alpha, line width and named line style of each patch.
+    Any other patch property (e.g. hatches) is dropped.
+
+    Parameters
+    ----------
+    patches : Sequence[Polygon]
+        The patches to merge.
+    zorder : int
+        The zorder of the collection.
+    rasterized : bool, optional
+        Whether to rasterize the collection, by default False.
+
+    Returns
+    -------
+    PatchCollection
+        The collection of patches.
+    """
+    # Patches share the same default cap and join styles, unlike collections.
+    styles = dict()
+    if patches:
+        styles["capstyle"] = patches[0].get_capstyle()
+        styles["joinstyle"] = patches[0].get_joinstyle()
+
+    collection = PatchCollection(
+        patches,
+        match_original=True,
+        zorder=zorder,
+        rasterized=rasterized,
+        **styles,
+    )
+    return collection
+
+
+def mergeable_patches(layout: Layout, qubits: Sequence[str], key: str) -> bool:
+    """
+    mergeable_patches Checks if the patches of a set of qubits only use patch
+    parameters that are preserved by get_patch_collection.
+
+    Parameters
+    ----------
+    layout : Layout
+        The layout.
+    qubits : Sequence[str]
+        The qubits the patches are drawn for.
+    key : str
+        The metaparams item that defines the patch parameters, e.g. 'circle'.
+
+    Returns
+    -------
+    bool
+        Whether the patches can be merged into a single collection.
+    """
+    for qubit in qubits:
+        patch_params = layout.param("metaparams", qubit).get(key) or {}
+        if not MERGEABLE_PATCH_PARAMS.issuperset(patch_params):
+            return False
+        for style_key in ("linestyle", "ls"):
+            style = patch_params.get(style_key, "-")
+            if not isinstance(style, str) or style in NONE_LINESTYLES:
+                return False
+    return True
+
+
+def qubit_coords(layout: Layout) -> Dict[str, Coordinates]:
+    """
+    qubit_coords Returns the plotting coordinates of every qubit in a layout,
+    such that plot can look them up once and share them between the artists.
+
+    Parameters
+    ----------
+    layout : Layout
+        The layout.
+
+    Returns
+    -------
+    Dict[str, Coordinates]
+        The (inverted) coordinates of each qubit.
+    """
+    qubits = layout.get_qubits()
+    coords = {qubit: invert(layout.param("coords", qubit)) for qubit in qubits}
+    return coords
+
+
+def qubit_labels(
+    layout: Layout, all_coords: Optional[Dict[str, Coordinates]] = None
+) -> Iterable[Text]:
     qubits = layout.get_qubits()
+    if all_coords is None:
+        all_coords = qubit_coords(layout)
 
     for qubit in qubits:
-        coords = invert(layout.param("coords", qubit))
+        coords = all_coords[qubit]
 
         metaparams = layout.param("metaparams", qubit)
         text_params = metaparams.get("text")
@@ -166,18 +409,22 @@ def qubit_labels(layout: Layout) -> Iterable[Text]:
             yield get_label(qubit, coords)
 
 
-def qubit_connections(layout: Layout) -> Iterable[Line2D]:
+def qubit_connections(
+    layout: Layout, all_coords: Optional[Dict[str, Coordinates]] = None
+) -> Iterable[Line2D]:
     anc_qubits = layout.get_qubits(role="anc")
+    if all_coords is None:
+        all_coords = qubit_coords(layout)
 
     for anc_qubit in anc_qubits:
-        anc_coords = invert(layout.param("coords", anc_qubit))
+        anc_coords = all_coords[anc_qubit]
 
         metaparams = layout.param("metaparams", anc_qubit)
         line_params = metaparams.get("line")
 
         neighbors = layout.get_neighbors(anc_qubit)
         for nbr in neighbors:
-            nbr_coords = invert(layout.param("coords", nbr))
+            nbr_coords = all_coords[nbr]
             line_coords = (anc_coords, nbr_coords)
 
             if line_params:
@@ -186,7 +433,9 @@ def qubit_connections(layout: Layout) -> Iterable[Line2D]:
                 yield get_line(line_coords)
 
 
-def qubit_artists(layout: Layout) -> Iterable[Circle]:
+def qubit_artists(
+    layout: Layout, all_coords: Optional[Dict[str, Coordinates]] = None
+) -> Iterable[Circle]:
     """
     draw_qubits Draws the qubits of a layout.
 
@@ -196,11 +445,16 @@ def qubit_artists(layout: Layout) -> Iterable[Circle]:
         The axis to draw the qubits on.
     layout : Layout
         The layout to draw the qubits of.
+    all_coords : Optional[Dict[str, Coordinates]], optional
+        The plotting coordinates of the qubits, as returned by qubit_coords,
+        by default None, in which case they are looked up from the layout.
     """
     qubits = layout.get_qubits()
+    if all_coords is None:
+        all_coords = qubit_coords(layout)
 
     for qubit in qubits:
-        coords = invert(layout.param("coords", qubit))
+        coords = all_coords[qubit]
 
         metaparams = layout.param("metaparams", qubit)
         circle_params = metaparams.get("circle")
@@ -213,7 +467,9 @@ def qubit_artists(layout: Layout) -> Iterable[Circle]:
             yield get_circle(coords, radius)
 
 
-def patch_artists(layout: Layout) -> Iterable[Polygon]:
+def patch_artists(
+    layout: Layout, all_coords: Optional[Dict[str, Coordinates]] = None
+) -> Iterable[Polygon]:
     """
     draw_patches Draws the stabilizer patches of a layout.
 
@@ -223,34 +479,51 @@ def patch_artists(layout: Layout) -> Iterable[Polygon]:
         The axis to draw the patches on.
     layout : Layout
         The layout to draw the patches of.
+    all_coords : Optional[Dict[str, Coordinates]], optional
+        The plotting coordinates of the qubits, as returned by qubit_coords,
+        by default None, in which case they are looked up from the layout.
     """
     anc_qubits = layout.get_qubits(role="anc")
+    if all_coords is None:
+        all_coords = qubit_coords(layout)
+
     for anc_qubit in anc_qubits:
-        anc_coords = invert(layout.param("coords", anc_qubit))
+        anc_coords = all_coords[anc_qubit]
 
         metaparams = layout.param("metaparams", anc_qubit)
         patch_params = metaparams.get("patch")
 
         neigbors = layout.get_neighbors(anc_qubit)
+        num_neigbors = len(neigbors)
 
-        coords = [invert(layout.param("coords", nbr)) for nbr in neigbors]
+        # Neighbours along the diagonal directions are already in clockwise order.
+        ordered_nbrs = [
+            nbr
+            for direction in CLOCKWISE_DIRECTIONS
+            for nbr in layout.get_neighbors(anc_qubit, direction=direction)
+        ]
+        is_ordered = len(ordered_nbrs) == num_neigbors
+        if is_ordered:
+            neigbors = ordered_nbrs
+
+        coords = [all_coords[nbr] for nbr in neigbors]
 
-        num_neigbors = len(neigbors)
         if num_neigbors == 2:
             coords.append(anc_coords)
 
-        patch_coords = clockwise_sort(coords)
+        patch_coords = coords if is_ordered else clockwise_sort(coords)
         if patch_params:
             yield get_patch(patch_coords, **patch_params)
         else:
             yield get_patch(patch_coords)
 
 
-def get_coord_range(layout: Layout) -> Tuple[CoordRange, CoordRange]:
-    qubits = layout.get_qubits()
-
-    inv_coords = (layout.param("coords", qubit) for qubit in qubits)
-    coords = map(invert, inv_coords)
+def get_coord_range(
+    layout: Layout, all_coords: Optional[Dict[str, Coordinates]] = None
+) -> Tuple[CoordRange, CoordRange]:
+    if all_coords is None:
+        all_coords = qubit_coords(layout)
+    coords = all_coords.values()
     x_coords, y_coords = zip(*coords)
 
     x_range: CoordRange = (min(x_coords), max(x_coords))
@@ -266,6 +539,7 @@ def plot(
     add_connections: bool = True,
     set_limits: bool = True,
     pad: float = 1,
+    rasterize_patches: bool = False,
 ) -> Union[Figure, None]:
     """
     plot Plots a layout.
@@ -279,36 +553,72 @@ def plot(
     add_labels : bool, optional
         Whether to add qubit labels , by default True
     add_patches : bool, optional
-        Whether to plot stabilizer patches, by default True
+        Whether to plot stabilizer patches, by default True.
+        The qubit circles and the patches are each drawn as a single collection,
+        unless their 'circle' or 'patch' metaparams use parameters other than
+        the colors, alpha, line width and named line style, in which case each
+        circle or patch is drawn individually.
     set_limits : bool, optional
         Whether to set the figure limits, by default True
     add_connections : bool, optional
-        Whether to plot lines indicating the connectivity, by default True
+        Whether to plot lines indicating the connectivity, by default True.
+        The lines are drawn as a single collection, unless the 'line' metaparams
+        of any ancilla use parameters other than the color, alpha, width and
+        named style or mix solid and dashed lines with different cap styles,
+        in which case each line is drawn individually.
     pad : float, optional
         The padding to the bottom axis, by default 2
+    rasterize_patches : bool, optional
+        Whether to rasterize the qubit circles and stabilizer patches when saving
+        to a vector format, by default False. This speeds up exporting large layouts,
+        while the connections and labels remain vector graphics.
 
     Returns
     -------
     Union[Figure, None]
         The figure the layout was plotted on.
     """
-    for artist in qubit_artists(layout):
-        axis.add_artist(artist)
+    all_coords = qubit_coords(layout)
+
+    circles = list(qubit_artists(layout, all_coords))
+    if mergeable_patches(layout, layout.get_qubits(), "circle"):
+        circle_collection = get_patch_collection(
+            circles, ZORDERS["circle"], rasterize_patches
+        )
+        axis.add_collection(circle_collection, autolim=False)
+    else:
+        for artist in circles:
+            artist.set_rasterized(rasterize_patches)
+            axis.add_artist(artist)
 
     if add_patches:
-        for artist in patch_artists(layout):
-            axis.add_artist(artist)
+        patches = list(patch_artists(layout, all_coords))
+        anc_qubits = layout.get_qubits(role="anc")
+        if mergeable_patches(layout, anc_qubits, "patch"):
+            patch_collection = get_patch_collection(
+                patches, ZORDERS["patch"], rasterize_patches
+            )
+            axis.add_collection(patch_collection, autolim=False)
+        else:
+            for artist in patches:
+                artist.set_rasterized(rasterize_patches)
+                axis.add_artist(artist)
 
     if add_connections:
-        for artist in qubit_connections(layout):
-            axis.add_artist(artist)
+        lines = list(qubit_connections(layout, all_coords))
+        if mergeable_lines(layout, lines):
+            line_collection = get_line_collection(lines)
+            axis.add_collection(line_collection, autolim=False)
+        else:
+            for artist in lines:
+                axis.add_artist(artist)
 
     if add_labels:
-        for artist in qubit_labels(layout):
+        for artist in qubit_labels(layout, all_coords):
             axis.add_artist(artist)
 
     if set_limits:
-        x_range, y_range = get_coord_range(layout)
+        x_range, y_range = get_coord_range(layout, all_coords)
 
         x_min, x_max = x_range
         axis.set_xlim(x_min - pad, x_max + pad)
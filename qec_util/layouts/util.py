@@ -4,6 +4,8 @@ from itertools import count
 
 from .layout import Layout
 
+CARDINAL_SHIFTS = dict(north=1, south=-1, east=1, west=-1)  # Coordinate shifts
+
 
 def set_coords(layout: Layout) -> None:
     """
@@ -14,14 +16,8 @@ def set_coords(layout: Layout) -> None:
     layout : Layout
         The layout to set the coordinates of.
     """
-
-    # Get the shift in the coordinate for a given direction.
-    def get_shift(direction: str) -> int:
-        if direction in ("south", "west"):
-            return -1
-        return 1
-
-    nodes = list(layout.graph.nodes)  # graph nodes
+    graph = layout.graph
+    nodes = list(graph.nodes)  # graph nodes
     init_node = nodes.pop()  # initial node
     init_coord = [0, 0]  # initial coordinates
 
@@ -33,13 +29,13 @@ def set_coords(layout: Layout) -> None:
     while queue:
         node, coords = queue.pop()
 
-        layout.graph.nodes[node]["coords"] = coords
+        layout.set_param("coords", node, coords)
         set_nodes.add(node)
 
-        for _, nbr_node, ord_dir in layout.graph.edges(node, data="direction"):
+        for _, nbr_node, ord_dir in graph.edges(node, data="direction"):
             if nbr_node not in set_nodes:
                 card_dirs = ord_dir.split("_")
-                shifts = tuple(map(get_shift, card_dirs))
+                shifts = tuple(CARDINAL_SHIFTS[card_dir] for card_dir in card_dirs)
                 nbr_coords = list(map(sum, zip(coords, shifts)))
                 queue.appendleft((nbr_node, nbr_coords))
 
@@ -64,7 +60,8 @@ def index_chain(layout: Layout, init_node: str) -> None:
     ValueError
         If any qubit is connected to more than 2 other qubits.
     """
-    nodes = list(layout.graph.nodes)
+    graph = layout.graph
+    nodes = list(graph.nodes)
     chain_inds = count(0, 1)
 
     if init_node not in nodes:
@@ -78,10 +75,10 @@ def index_chain(layout: Layout, init_node: str) -> None:
     while queue:
         node = queue.pop()
         ind = next(chain_inds)
-        layout.graph.nodes[node]["chain_ind"] = ind
+        layout.set_param("chain_ind", node, ind)
         set_nodes.add(node)
 
-        neighbors = list(layout.graph.adj[node])
+        neighbors = list(graph.adj[node])
         num_neighbors = len(neighbors)
         if num_neighbors > 2:
             raise ValueError(
@@ -98,4 +95,4 @@ def index_chain(layout: Layout, init_node: str) -> None:
 
     for node in nodes:
         if node not in set_nodes:
-            layout.graph.nodes[node]["chain_ind"] = None
+            layout.set_param("chain_ind", node, None)
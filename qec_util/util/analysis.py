@@ -6,17 +6,41 @@ from uncertainties import ufloat
 
 
 def error_prob(predictions: np.ndarray, values: np.ndarray) -> float:
-    return np.mean(predictions ^ values)
+    errors = predictions ^ values
+    return np.count_nonzero(errors) / errors.size
 
 
 def logical_fidelity(predictions: np.ndarray, values: np.ndarray) -> float:
     return 1 - error_prob(predictions, values)
 
 
+# Minimum number of rounds for which the exponential form of the decay is faster
+MIN_EXP_DECAY_SIZE = 256
+
+
+def _decay_factor(
+    qec_round: Union[int, np.ndarray], error_rate: float
+) -> Union[float, np.ndarray]:
+    """
+    Computes (1 - 2 * error_rate) ** qec_round. For error rates below 0.5 and
+    at least MIN_EXP_DECAY_SIZE rounds, the power is evaluated as the faster
+    exp(log1p(-2 * error_rate) * qec_round) instead. This is accurate to a
+    relative error of about 1e-12 (up to a few thousand ulp for thousands of
+    rounds), compared to below 1 ulp for the power.
+    """
+    if (
+        np.isscalar(error_rate)
+        and 0 <= error_rate < 0.5
+        and np.size(qec_round) >= MIN_EXP_DECAY_SIZE
+    ):
+        return np.exp(np.log1p(-2 * error_rate) * qec_round)
+    return (1 - 2 * error_rate) ** qec_round
+
+
 def error_prob_decay(
     qec_round: Union[int, np.ndarray], error_rate: float
 ) -> Union[int, np.ndarray]:
-    return 0.5 * (1 - (1 - 2 * error_rate) ** qec_round)
+    return 0.5 * (1 - _decay_factor(qec_round, error_rate))
 
 
 def logical_fidelity_decay(
@@ -33,7 +57,7 @@ class LogicalFidelityDecay(lmfit.model.Model):
     def __init__(self):
         # pass in the model's equation
         def funct(x, error_rate):
-            return 0.5 + 0.5 * (1 - 2 * error_rate) ** x
+            return 0.5 + 0.5 * _decay_factor(x, error_rate)
 
         super().__init__(funct)
 